@@ -4,7 +4,6 @@ import sys
 import argparse
 import importlib
 import threading
-from pathlib import Path
 import pygame
 
 # Load environment variables from .env if python-dotenv is available
@@ -27,8 +26,7 @@ from workers.audio_worker import AudioWorker
 from workers.recognition_worker import RecognitionWorker
 from logger import get_logger
 from renderers import create_renderer
-
-ROOT = Path(__file__).resolve().parent
+from utils import preload_fonts
 
 
 def register_intents(intent_router: IntentRouter, scene_manager: SceneManager, app_context: AppContext):
@@ -156,6 +154,9 @@ def main():
     app_context.preload_progress = 0.0
     app_context.preload_done = False
     
+    # Load the common font sizes now so the first frame of each scene doesn't hitch
+    preload_fonts()
+    
     # Eagerly register and switch to Splash
     scene_manager.register_scene('SplashScene', SplashScene(app_context))
     
@@ -205,9 +206,6 @@ def main():
                     lambda idx=index: intent_router.emit(Intents.SELECT_OPTION, index=idx)
                 )
     register_voice_commands(voice_router, intent_router)
-    voice_router.register_command("three", lambda: intent_router.emit("select_option", index=2))
-    voice_router.register_command("3", lambda: intent_router.emit("select_option", index=2))  # Number variant
-    voice_router.register_command("third", lambda: intent_router.emit("select_option", index=2))  # Alternative
     
     # Start voice engine
     voice_engine.start()
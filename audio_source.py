@@ -22,14 +22,18 @@ _buffer_size = 4096  # Increased from 2048 to prevent overflow on Pi
 _sample_rate = 44100
 _fallback_time = 0.0
 _fallback_freq = 220.0  # A3 note
+_reported_statuses = set()  # Stream statuses already printed (callback runs per block)
 
 
 def _audio_callback(indata, frames, time_info, status):
     """Callback for sounddevice stream."""
     global _audio_buffer
-    if status and 'overflow' not in str(status).lower():
-        # Only print non-overflow errors
-        print(f"Audio status: {status}")
+    if status:
+        status_str = str(status)
+        # Only print non-overflow errors, and each distinct status once
+        if 'overflow' not in status_str.lower() and status_str not in _reported_statuses:
+            _reported_statuses.add(status_str)
+            print(f"Audio status: {status_str}")
     _audio_buffer = indata[:, 0].copy()  # Mono channel
 
 
@@ -9,6 +9,13 @@ import pygame
 from typing import Any
 from .base import RendererBase
 from .frame_state import FrameState, ShapeType
+from utils import render_text
+
+# System font matched for each font family (anything else falls back to sans)
+FONT_FAMILY_NAMES = {
+    "monospace": "courier",
+    "sans-serif": "arial",
+}
 
 
 class PygameRenderer(RendererBase):
@@ -22,7 +29,16 @@ class PygameRenderer(RendererBase):
         """
         super().__init__(config)
         self.screen: pygame.Surface = None
-        self.font_cache = {}  # Cache fonts by (size, family)
+        self.font_cache = {}  # Cache fonts by (path, size)
+        self._font_paths = {}  # Resolved font file by (family, bold)
+        
+        # Shape type -> draw method, built once instead of an if/elif chain per shape
+        self._shape_drawers = {
+            ShapeType.RECT: self._draw_rect,
+            ShapeType.CIRCLE: self._draw_circle,
+            ShapeType.LINE: self._draw_line,
+            ShapeType.POLYGON: self._draw_polygon,
+        }
     
     def initialize(self):
         """Initialize pygame and create display."""
@@ -46,13 +62,29 @@ class PygameRenderer(RendererBase):
         Returns:
             pygame.Font instance
         """
-        key = (size, family, bold)
-        if key not in self.font_cache:
-            if family == "monospace":
-                self.font_cache[key] = pygame.font.Font(pygame.font.match_font('courier', bold=bold), size)
-            else:
-                self.font_cache[key] = pygame.font.Font(pygame.font.match_font('arial', bold=bold), size)
-        return self.font_cache[key]
+        path = self._resolve_font_path(family, bold)
+        key = (path, size)
+        font = self.font_cache.get(key)
+        if font is None:
+            font = pygame.font.Font(path, size)
+            self.font_cache[key] = font
+        return font
+    
+    def _resolve_font_path(self, family: str, bold: bool = False):
+        """Resolve a font family to a font file, matching system fonts only once.
+        
+        Args:
+            family: Font family
+            bold: Bold font
+            
+        Returns:
+            Path to the font file, or None for pygame's default font
+        """
+        key = (family, bold)
+        if key not in self._font_paths:
+            name = FONT_FAMILY_NAMES.get(family, FONT_FAMILY_NAMES["sans-serif"])
+            self._font_paths[key] = pygame.font.match_font(name, bold=bold)
+        return self._font_paths[key]
     
     def render(self, frame_state: FrameState):
         """Render a frame using pygame.
@@ -81,34 +113,44 @@ class PygameRenderer(RendererBase):
     
     def _render_shape(self, shape):
         """Render a shape."""
-        color = shape.color[:3]  # RGB only for pygame
-        
-        if shape.shape_type == ShapeType.RECT:
-            x, y = shape.position
-            w, h = shape.size
-            rect = pygame.Rect(int(x), int(y), int(w), int(h))
-            pygame.draw.rect(self.screen, color, rect, shape.thickness)
-        
-        elif shape.shape_type == ShapeType.CIRCLE:
-            x, y = shape.position
-            radius = int(shape.size[0])
-            pygame.draw.circle(self.screen, color, (int(x), int(y)), radius, shape.thickness)
-        
-        elif shape.shape_type == ShapeType.LINE:
-            if len(shape.points) >= 2:
-                points = [(int(x), int(y)) for x, y in shape.points]
-                pygame.draw.lines(self.screen, color, False, points, shape.thickness)
-        
-        elif shape.shape_type == ShapeType.POLYGON:
-            if len(shape.points) >= 3:
-                points = [(int(x), int(y)) for x, y in shape.points]
-                pygame.draw.polygon(self.screen, color, points, shape.thickness)
+        draw = self._shape_drawers.get(shape.shape_type)
+        if draw:
+            draw(shape, shape.color[:3])  # RGB only for pygame
+    
+    def _draw_rect(self, shape, color):
+        """Draw a rectangle shape."""
+        x, y = shape.position
+        w, h = shape.size
+        rect = pygame.Rect(int(x), int(y), int(w), int(h))
+        pygame.draw.rect(self.screen, color, rect, shape.thickness)
+    
+    def _draw_circle(self, shape, color):
+        """Draw a circle shape."""
+        x, y = shape.position
+        radius = int(shape.size[0])
+        pygame.draw.circle(self.screen, color, (int(x), int(y)), radius, shape.thickness)
+    
+    def _draw_line(self, shape, color):
+        """Draw a line/polyline shape."""
+        if len(shape.points) >= 2:
+            points = [(int(x), int(y)) for x, y in shape.points]
+            pygame.draw.lines(self.screen, color, False, points, shape.thickness)
+    
+    def _draw_polygon(self, shape, color):
+        """Draw a polygon shape."""
+        if len(shape.points) >= 3:
+            points = [(int(x), int(y)) for x, y in shape.points]
+            pygame.draw.polygon(self.screen, color, points, shape.thickness)
     
     def _render_text(self, text):
         """Render text."""
-        font = self.get_font(text.font_size, text.font_family, text.bold)
-        color = text.color[:3]  # RGB only
-        surface = font.render(text.content, True, color)
+        color = tuple(text.color[:3])  # RGB only
+        if text.bold:
+            font = self.get_font(text.font_size, text.font_family, text.bold)
+            surface = font.render(text.content, True, color)
+        else:
+            # Same cached path the scenes use (utils.render_text has no bold variant)
+            surface = render_text(text.content, text.font_size, mono=(text.font_family == "monospace"), color=color)
         
         x, y = text.position
         if text.align == "center":
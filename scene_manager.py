@@ -2,7 +2,13 @@
 import pygame
 import threading
 import time
+import numpy as np
 from typing import Dict, Optional, Type, Callable
+from audio_source import get_audio_frame, get_sample_rate
+from intent_router import Intents
+from utils import (render_text, get_matrix_green, dim_color, draw_scanlines, draw_footer, draw_back_arrow,
+                   MARGIN_TOP, MARGIN_LEFT, HUB_TITLE_Y_OFFSET, HUB_SUBTITLE_Y_OFFSET,
+                   HUB_MENU_START_Y_OFFSET, HUB_MENU_LINE_HEIGHT)
 
 
 # Global scene registry
@@ -119,8 +125,6 @@ class BaseAudioScene(Scene):
             fft_size: FFT buffer size
         """
         super().__init__(ctx)
-        import numpy as np
-        from audio_source import get_sample_rate
         
         self.sample_rate = get_sample_rate()  # Use actual audio source sample rate
         self.fft_size = fft_size
@@ -139,7 +143,6 @@ class BaseAudioScene(Scene):
     
     def update_audio_buffer(self):
         """Update audio buffer from centralized audio source."""
-        from audio_source import get_audio_frame
         self.audio_buffer = get_audio_frame(length=self.fft_size)
     
     def on_exit(self):
@@ -162,6 +165,8 @@ class BaseHubScene(Scene):
         """
         super().__init__(ctx)
         self.color = (140, 255, 140)
+        self.dim_color = dim_color(self.color)
+        self.help_color = dim_color(self.color, 0.33)
         self.bg = (0, 0, 0)
         self.title = title
         self.items = items
@@ -171,8 +176,9 @@ class BaseHubScene(Scene):
     
     def on_enter(self):
         """Initialize hub scene."""
-        from utils import get_matrix_green
         self.color = get_matrix_green(self.manager.config)
+        self.dim_color = dim_color(self.color)
+        self.help_color = dim_color(self.color, 0.33)
         self.selected_index = 0
     
     def handle_event(self, event: pygame.event.Event):
@@ -214,23 +220,20 @@ class BaseHubScene(Scene):
                 self.ctx.intent_router.emit(self.back_intent)
                 return True
             
-            # Check if click is on an item (matching draw layout)
-            from utils import MARGIN_TOP, MARGIN_LEFT, HUB_MENU_START_Y_OFFSET, HUB_MENU_LINE_HEIGHT
+            # Check if click is on an item (matching draw layout). Item rows are
+            # stacked back to back, so the row index follows directly from y
             w, h = self.manager.screen.get_size()
             start_y = MARGIN_TOP + HUB_MENU_START_Y_OFFSET
             
-            for i, item in enumerate(self.items):
-                y = start_y + i * HUB_MENU_LINE_HEIGHT
-                item_rect = pygame.Rect(MARGIN_LEFT, y - 5, int(w * 0.6), HUB_MENU_LINE_HEIGHT)
-                if item_rect.collidepoint(mx, my):
-                    self._select_item(i)
-                    return True
+            i = (my - (start_y - 5)) // HUB_MENU_LINE_HEIGHT
+            if 0 <= i < len(self.items) and MARGIN_LEFT <= mx < MARGIN_LEFT + int(w * 0.6):
+                self._select_item(i)
+                return True
         
         return False
     
     def _select_item(self, index: int):
         """Select a sub-experience by index."""
-        from intent_router import Intents
         if 0 <= index < len(self.items):
             item = self.items[index]
             self.ctx.intent_router.emit(Intents.SELECT_SUB_EXPERIENCE, id=item["id"])
@@ -241,28 +244,25 @@ class BaseHubScene(Scene):
     
     def draw(self, screen: pygame.Surface):
         """Draw the ASCII-style hub menu."""
-        from utils import (get_font, draw_scanlines, draw_footer, draw_back_arrow, 
-                          MARGIN_TOP, MARGIN_LEFT, HUB_TITLE_Y_OFFSET, HUB_SUBTITLE_Y_OFFSET,
-                          HUB_MENU_START_Y_OFFSET, HUB_MENU_LINE_HEIGHT)
-        
         screen.fill(self.bg)
         w, h = screen.get_size()
         
         # Draw back arrow
         self.back_arrow_rect = draw_back_arrow(screen, self.color)
         
+        # Text is collected and blitted in one batch below. render_text caches
+        # surfaces on first use, shared by all hubs (help lines are identical)
+        blit_list = []
+        
         # Title - left aligned with margin
-        title_font = get_font(48)
-        title_surface = title_font.render(self.title, True, self.color)
-        screen.blit(title_surface, (MARGIN_LEFT, MARGIN_TOP + HUB_TITLE_Y_OFFSET))
+        title_surface = render_text(self.title, 48, color=self.color)
+        blit_list.append((title_surface, (MARGIN_LEFT, MARGIN_TOP + HUB_TITLE_Y_OFFSET)))
         
         # Subtitle - left aligned with margin
-        subtitle_font = get_font(24)
-        subtitle = subtitle_font.render("select a visualization:", True, self.color)
-        screen.blit(subtitle, (MARGIN_LEFT, MARGIN_TOP + HUB_SUBTITLE_Y_OFFSET))
+        subtitle = render_text("select a visualization:", 24, color=self.color)
+        blit_list.append((subtitle, (MARGIN_LEFT, MARGIN_TOP + HUB_SUBTITLE_Y_OFFSET)))
         
         # Menu items - left aligned with margin
-        item_font = get_font(32)
         start_y = MARGIN_TOP + HUB_MENU_START_Y_OFFSET
         
         for i, item in enumerate(self.items):
@@ -272,22 +272,21 @@ class BaseHubScene(Scene):
                 color = self.color
             else:
                 prefix = "  "
-                from utils import dim_color
-                color = dim_color(self.color)
+                color = self.dim_color
             
-            text = item_font.render(f"{prefix}{item['label']}", True, color)
-            screen.blit(text, (MARGIN_LEFT, start_y + i * HUB_MENU_LINE_HEIGHT))
+            text = render_text(f"{prefix}{item['label']}", 32, color=color)
+            blit_list.append((text, (MARGIN_LEFT, start_y + i * HUB_MENU_LINE_HEIGHT)))
         
         # Instructions - left aligned at bottom
-        from utils import dim_color
-        help_font = get_font(18)
         help_text = "press 1-3, arrow keys + enter, click, or use voice"
-        help_surface = help_font.render(help_text, True, dim_color(self.color, 0.33))
-        screen.blit(help_surface, (MARGIN_LEFT, h - 100))
+        help_surface = render_text(help_text, 18, color=self.help_color)
+        blit_list.append((help_surface, (MARGIN_LEFT, h - 100)))
         
         esc_text = "esc: return to main menu"
-        esc_surface = help_font.render(esc_text, True, dim_color(self.color, 0.33))
-        screen.blit(esc_surface, (MARGIN_LEFT, h - 75))
+        esc_surface = render_text(esc_text, 18, color=self.help_color)
+        blit_list.append((esc_surface, (MARGIN_LEFT, h - 75)))
+        
+        screen.blits(blit_list, doreturn=False)
         
         draw_scanlines(screen)
         draw_footer(screen, self.color)
@@ -21,12 +21,15 @@ class Experience1LissajousScene(Scene):
         """Initialize Lissajous scene."""
         self.color = get_matrix_green(self.manager.config)
         
-        # Create visualizer with config
-        self.visualizer = LissajousVisualizer(self.manager.config)
+        # Create visualizer with config on first entry; reuse it (and its buffers) after
+        if self.visualizer is None:
+            self.visualizer = LissajousVisualizer(self.manager.config)
+        else:
+            self.visualizer.reset()
     
     def on_exit(self):
         """Clean up scene."""
-        self.visualizer = None
+        pass
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
@@ -19,14 +19,20 @@ class Experience1SpectrumBarsScene(BaseAudioScene):
         self.color = (140, 255, 140)
         self.bg = (0, 0, 0)
         self.visualizer = None
+        
+        # FFT window depends only on fft_size; build it once
+        self.window = np.hanning(self.fft_size)
     
     def on_enter(self):
         """Initialize audio visualization."""
         self.color = get_matrix_green(self.manager.config)
         
-        # Create visualizer - pass visualizers config section
-        viz_config = self.manager.config.get('visualizers', {}).get('spectrum_bars', {})
-        self.visualizer = SpectrumBarsVisualizer(viz_config)
+        # Create visualizer on first entry - pass visualizers config section
+        if self.visualizer is None:
+            viz_config = self.manager.config.get('visualizers', {}).get('spectrum_bars', {})
+            self.visualizer = SpectrumBarsVisualizer(viz_config)
+        else:
+            self.visualizer.reset()
         
         # Start audio stream (from BaseAudioScene)
         self.start_audio_stream()
@@ -34,7 +40,6 @@ class Experience1SpectrumBarsScene(BaseAudioScene):
     def on_exit(self):
         """Clean up scene."""
         self.stop_audio_stream()
-        self.visualizer = None
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
@@ -47,17 +52,19 @@ class Experience1SpectrumBarsScene(BaseAudioScene):
         
         if self.visualizer and len(self.audio_buffer) >= self.fft_size:
             # Perform FFT
-            windowed = self.audio_buffer * np.hanning(self.fft_size)
+            windowed = self.audio_buffer * self.window
             fft_data = np.fft.rfft(windowed)
             magnitudes = np.abs(fft_data[:self.fft_size // 2])
             
-            # Normalize
-            magnitudes = np.maximum(magnitudes, 1e-10)
-            db_magnitudes = 20 * np.log10(magnitudes)
-            normalized = np.clip((db_magnitudes + 60) / 60, 0, 1)
+            # Normalize -60..0 dB to 0..1 in place: (20*log10(m) + 60) / 60 == log10(m)/3 + 1
+            np.maximum(magnitudes, 1e-10, out=magnitudes)
+            np.log10(magnitudes, out=magnitudes)
+            magnitudes /= 3
+            magnitudes += 1
+            np.clip(magnitudes, 0, 1, out=magnitudes)
             
             # Update visualizer
-            audio_data = {'fft': normalized}
+            audio_data = {'fft': magnitudes}
             self.visualizer.update(audio_data, dt)
     
     def draw(self, screen: pygame.Surface):
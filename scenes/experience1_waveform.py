@@ -23,8 +23,11 @@ class Experience1WaveformScene(BaseAudioScene):
         """Start audio capture."""
         self.color = get_matrix_green(self.manager.config)
         
-        # Create visualizer
-        self.visualizer = WaveformVisualizer(self.manager.config)
+        # Create visualizer on first entry; reuse it after
+        if self.visualizer is None:
+            self.visualizer = WaveformVisualizer(self.manager.config)
+        else:
+            self.visualizer.reset()
         
         # Start audio stream (from BaseAudioScene)
         self.start_audio_stream()
@@ -32,7 +35,6 @@ class Experience1WaveformScene(BaseAudioScene):
     def on_exit(self):
         """Clean up scene."""
         self.stop_audio_stream()
-        self.visualizer = None
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
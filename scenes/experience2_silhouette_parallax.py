@@ -6,6 +6,15 @@ from utils import draw_scanlines, draw_footer, draw_back_arrow, MARGIN_TOP, MARG
 from intent_router import Intents
 from sprites.exp2_silhouettes import SILH_LEAD_GUITAR_A
 
+# ASCII characters for the background gradient effect
+GRADIENT_CHARS = ('.', ':', '-', '=', '+', '*', '#', '@')
+
+# Background grid cell size in pixels
+BG_CHAR_SIZE = 20
+
+# Block character for placeholder silhouettes
+BLOCK_CHAR = '█'
+
 
 @register_scene("Experience2SilhouetteParallaxScene")
 class Experience2SilhouetteParallaxScene(Scene):
@@ -26,11 +35,37 @@ class Experience2SilhouetteParallaxScene(Scene):
         # Time for animation
         self.time = 0
         self.back_arrow_rect = None
+        
+        # Fonts (resolved in on_enter)
+        self.bg_font = None
+        self.glyph_font = None
+        
+        # Pre-rendered glyph tiles: background chars (dimmed) and silhouette chars
+        self.bg_glyphs = []  # Indexed by gradient level
+        self.glyphs = {}
+        
+        # Whole background grid pre-drawn for the current screen size
+        self.bg_layer = None
+        self.bg_layer_size = None
     
     def on_enter(self):
         """Initialize parallax scene."""
         self.color = get_matrix_green(self.manager.config)
         
+        # Resolve fonts once rather than on every draw
+        self.bg_font = get_font(BG_CHAR_SIZE, mono=True)
+        self.glyph_font = get_font(8, mono=True)
+        
+        # Render each glyph once; draw only blits these tiles
+        dim_color = tuple(c // 4 for c in self.color)
+        self.bg_glyphs = [self.bg_font.render(ch, True, dim_color) for ch in GRADIENT_CHARS]
+        silhouette_chars = {BLOCK_CHAR}
+        for row in SILH_LEAD_GUITAR_A:
+            silhouette_chars.update(row)
+        silhouette_chars.discard(' ')
+        self.glyphs = {ch: self.glyph_font.render(ch, True, self.color) for ch in silhouette_chars}
+        self.bg_layer_size = None  # Tiles changed; rebuild the background layer on next draw
+        
         w, h = self.manager.screen.get_size()
         
         # Calculate usable area respecting all margins
@@ -72,6 +107,13 @@ class Experience2SilhouetteParallaxScene(Scene):
             }
         ]
         
+        # The shapes are static; compute their drawable cells once
+        for char in self.characters:
+            if char["type"] == "sprite":
+                char["cells"], char["pixel_width"], char["pixel_height"] = self._sprite_cells(char["sprite"])
+            else:
+                char["cells"] = self._silhouette_cells(char["width"], char["height"])
+        
         self.bg_scroll_x = 0
         self.time = 0
     
@@ -88,12 +130,8 @@ class Experience2SilhouetteParallaxScene(Scene):
         """Update parallax animation."""
         self.time += dt
         
-        # Update background scroll
-        self.bg_scroll_x += self.bg_scroll_speed
-        
-        # Wrap background scroll
-        if self.bg_scroll_x > 50:
-            self.bg_scroll_x = 0
+        # Update and wrap background scroll (speed is per 60 Hz frame)
+        self.bg_scroll_x = math.fmod(self.bg_scroll_x + self.bg_scroll_speed * dt * 60, 50.0)
     
     def draw(self, screen: pygame.Surface):
         """Draw the parallax scene."""
@@ -112,33 +150,58 @@ class Experience2SilhouetteParallaxScene(Scene):
         draw_scanlines(screen)
         draw_footer(screen, self.color)
     
-    def _draw_background(self, screen: pygame.Surface, w: int, h: int):
-        """Draw scrolling ASCII gradient background."""
-        # ASCII characters for gradient effect
-        gradient_chars = ['.', ':', '-', '=', '+', '*', '#', '@']
+    def _background_cells(self, w: int, h: int) -> list:
+        """Lay out the background gradient grid.
         
-        char_size = 20
-        font = get_font(char_size, mono=True)
+        Args:
+            w: Screen width in pixels
+            h: Screen height in pixels
+            
+        Returns:
+            List of (glyph_surface, x, y) with unscrolled pixel positions
+        """
+        char_size = BG_CHAR_SIZE
+        glyphs = self.bg_glyphs
+        levels = len(glyphs)
         
         # Calculate how many columns we need
         cols = (w // char_size) + 2
         rows = h // char_size
         
+        cells = []
         for row in range(rows):
             for col in range(cols):
-                # Calculate position with scroll offset
-                x = col * char_size - int(self.bg_scroll_x)
-                y = row * char_size
-                
-                # Create gradient pattern based on position
-                gradient_index = ((col + row) % len(gradient_chars))
-                char = gradient_chars[gradient_index]
-                
-                # Dim the background
-                dim_color = tuple(c // 4 for c in self.color)
-                
-                text = font.render(char, True, dim_color)
-                screen.blit(text, (x, y))
+                # Create gradient pattern based on position (index straight into the tiles)
+                cells.append((glyphs[(col + row) % levels], col * char_size, row * char_size))
+        
+        return cells
+    
+    def _build_background_layer(self, w: int, h: int) -> pygame.Surface:
+        """Pre-draw the background grid (including the scroll margin) onto one surface.
+        
+        Args:
+            w: Screen width in pixels
+            h: Screen height in pixels
+            
+        Returns:
+            Opaque surface of the unscrolled background
+        """
+        # Same column count as _background_cells: the screen plus two scroll columns
+        layer_w = ((w // BG_CHAR_SIZE) + 2) * BG_CHAR_SIZE
+        cells = self._background_cells(w, h)
+        layer = pygame.Surface((layer_w, h)).convert()
+        layer.fill(self.bg)
+        layer.blits([(glyph, (x, y)) for glyph, x, y in cells], doreturn=False)
+        return layer
+    
+    def _draw_background(self, screen: pygame.Surface, w: int, h: int):
+        """Draw scrolling ASCII gradient background."""
+        # The grid only depends on the screen size; each frame just shifts it
+        if self.bg_layer_size != (w, h):
+            self.bg_layer = self._build_background_layer(w, h)
+            self.bg_layer_size = (w, h)
+        
+        screen.blit(self.bg_layer, (-int(self.bg_scroll_x), 0))
     
     def _draw_characters(self, screen: pygame.Surface):
         """Draw silhouette characters with bob animation."""
@@ -153,24 +216,27 @@ class Experience2SilhouetteParallaxScene(Scene):
                 # Draw placeholder blocky character
                 x = int(char["x"] - char["width"] // 2)
                 y = int(char["y"] - char["height"] + bob_y)
-                self._draw_ascii_silhouette(screen, x, y, char["width"], char["height"])
+                self._draw_ascii_silhouette(screen, x, y, char["cells"])
     
-    def _draw_ascii_silhouette(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
-        """Draw a blocky ASCII character silhouette."""
-        # Use block characters to create silhouette
-        block_char = '█'
+    def _silhouette_cells(self, width: int, height: int) -> list:
+        """Compute the block offsets of a blocky humanoid silhouette.
+        
+        Args:
+            width: Silhouette width in pixels
+            height: Silhouette height in pixels
+            
+        Returns:
+            List of (x, y) pixel offsets of the blocks to draw
+        """
         char_size = 8
-        font = get_font(char_size, mono=True)
         
-        # Draw filled rectangle using ASCII blocks
+        # Fill rectangle using ASCII blocks
         cols = width // char_size
         rows = height // char_size
         
+        cells = []
         for row in range(rows):
             for col in range(cols):
-                char_x = x + col * char_size
-                char_y = y + row * char_size
-                
                 # Create simple humanoid shape (wider at shoulders, narrower at waist)
                 col_ratio = col / cols
                 row_ratio = row / rows
@@ -192,37 +258,50 @@ class Experience2SilhouetteParallaxScene(Scene):
                     if 0.4 < col_ratio < 0.6:
                         continue
                 
-                text = font.render(block_char, True, self.color)
-                screen.blit(text, (char_x, char_y))
+                cells.append((col * char_size, row * char_size))
+        
+        return cells
     
-    def _draw_sprite_silhouette(self, screen: pygame.Surface, char: dict, bob_y: float):
-        """Draw a sprite-based silhouette character.
+    def _draw_ascii_silhouette(self, screen: pygame.Surface, x: int, y: int, cells: list):
+        """Draw a blocky ASCII character silhouette from its precomputed block offsets."""
+        block = self.glyphs[BLOCK_CHAR]
+        screen.blits([(block, (x + dx, y + dy)) for dx, dy in cells], doreturn=False)
+    
+    def _sprite_cells(self, sprite: list) -> tuple:
+        """Collect the drawable (non-space) cells of a sprite.
         
         Args:
-            screen: Pygame surface to draw on
-            char: Character dict with sprite data
-            bob_y: Vertical bob offset
+            sprite: List of strings, one per sprite row
+            
+        Returns:
+            (cells, pixel_width, pixel_height) where cells is a list of
+            (glyph_surface, x, y) with pixel offsets from the sprite's top-left
         """
-        sprite = char["sprite"]
         char_size = 8
-        font = get_font(char_size, mono=True)
         
         # Calculate sprite dimensions
         sprite_height = len(sprite)
         sprite_width = max(len(row) for row in sprite) if sprite else 0
         
-        pixel_height = sprite_height * char_size
-        pixel_width = sprite_width * char_size
-        
-        # Center the sprite horizontally at char["x"]
-        start_x = int(char["x"] - pixel_width // 2)
-        start_y = int(char["y"] - pixel_height + bob_y)
-        
-        # Render each character in the sprite
+        cells = []
         for row_idx, row in enumerate(sprite):
             for col_idx, ch in enumerate(row):
                 if ch != ' ':  # Only draw non-space characters
-                    x = start_x + col_idx * char_size
-                    y = start_y + row_idx * char_size
-                    text = font.render(ch, True, self.color)
-                    screen.blit(text, (x, y))
+                    cells.append((self.glyphs[ch], col_idx * char_size, row_idx * char_size))
+        
+        return cells, sprite_width * char_size, sprite_height * char_size
+    
+    def _draw_sprite_silhouette(self, screen: pygame.Surface, char: dict, bob_y: float):
+        """Draw a sprite-based silhouette character.
+        
+        Args:
+            screen: Pygame surface to draw on
+            char: Character dict with precomputed sprite cells
+            bob_y: Vertical bob offset
+        """
+        # Center the sprite horizontally at char["x"]
+        start_x = int(char["x"] - char["pixel_width"] // 2)
+        start_y = int(char["y"] - char["pixel_height"] + bob_y)
+        
+        # Blit only the non-space cells found in on_enter
+        screen.blits([(glyph, (start_x + dx, start_y + dy)) for glyph, dx, dy in char["cells"]], doreturn=False)
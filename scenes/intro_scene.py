@@ -2,7 +2,7 @@
 import time
 import pygame
 from scene_manager import Scene, register_scene
-from utils import get_font, draw_scanlines, draw_footer
+from utils import get_font, get_matrix_green, draw_scanlines, draw_footer
 from renderers import FrameState, Text
 
 
@@ -18,20 +18,23 @@ class IntroScene(Scene):
         self.current_line_idx = 0
         self.current_char_idx = 0
         self.shown_text = ""
-        self.completed_lines = []  # Store completed lines
+        self.completed_surfaces = []  # Rendered completed lines, drawn every frame
+        self.current_surface = None  # Rendered line being typed
+        self.current_surface_text = None
+        self.cursor_surface = None
         self.line_start_time = 0
         self.char_timer = 0
         self.linger_timer = 0
         self.pause_timer = 0
         self.state = "typing"  # typing, lingering, pausing, done
         self.base_font_size = 32  # Smaller, more terminal-like
+        self.font = None
         self.margin_x = 0
         self.margin_y = 0
         self.line_height = 0
     
     def on_enter(self):
         """Initialize intro sequence."""
-        from utils import get_matrix_green
         cfg = self.manager.config
         self.lines = cfg.get("intro_texts", [])
         self.color = get_matrix_green(cfg)
@@ -42,12 +45,16 @@ class IntroScene(Scene):
         self.margin_y = int(h * 0.12)  # Top margin
         self.base_font_size = max(28, int(h * 0.04))  # Terminal-sized font
         self.line_height = int(self.base_font_size * 1.5)  # Line spacing
+        self.font = get_font(self.base_font_size)
+        self.cursor_surface = self.font.render("_", True, self.color)
         
         # Reset state
         self.current_line_idx = 0
         self.current_char_idx = 0
         self.shown_text = ""
-        self.completed_lines = []
+        self.completed_surfaces = []
+        self.current_surface = None
+        self.current_surface_text = None
         self.line_start_time = time.time()
         self.char_timer = 0
         self.linger_timer = 0
@@ -105,13 +112,24 @@ class IntroScene(Scene):
             self.pause_timer += dt
             if self.pause_timer >= 0.4:  # Pause 400ms between lines
                 # Save completed line and move to next
-                self.completed_lines.append(current_line)
+                self.completed_surfaces.append(self._render_line(current_line))
                 self.current_line_idx += 1
                 self.current_char_idx = 0
                 self.shown_text = ""
                 self.line_start_time = time.time()
                 self.state = "typing"
     
+    def _render_line(self, text: str) -> pygame.Surface:
+        """Render one terminal line with its prompt.
+        
+        Args:
+            text: Line text without the prompt
+            
+        Returns:
+            Rendered text surface
+        """
+        return self.font.render(f"> {text}", True, self.color)
+    
     def draw(self, screen: pygame.Surface):
         """Draw the terminal-style typewriter text."""
         # Clear screen
@@ -119,26 +137,23 @@ class IntroScene(Scene):
         
         y_pos = self.margin_y
         
-        # Draw all completed lines
-        for line in self.completed_lines:
-            text_with_prompt = f"> {line}"
-            font = get_font(self.base_font_size)
-            img = font.render(text_with_prompt, True, self.color)
+        # Draw all completed lines (rendered once when each line finished)
+        for img in self.completed_surfaces:
             screen.blit(img, (self.margin_x, y_pos))
             y_pos += self.line_height
         
-        # Draw current line being typed
+        # Draw current line being typed; re-render only when a character is added
         if self.shown_text:
-            text_with_prompt = f"> {self.shown_text}"
-            font = get_font(self.base_font_size)
-            img = font.render(text_with_prompt, True, self.color)
+            if self.shown_text != self.current_surface_text:
+                self.current_surface = self._render_line(self.shown_text)
+                self.current_surface_text = self.shown_text
+            img = self.current_surface
             screen.blit(img, (self.margin_x, y_pos))
             
             # Add blinking cursor
             if int(time.time() * 2) % 2 == 0:  # Blink every 0.5 seconds
                 cursor_x = self.margin_x + img.get_width() + 5
-                cursor = font.render("_", True, self.color)
-                screen.blit(cursor, (cursor_x, y_pos))
+                screen.blit(self.cursor_surface, (cursor_x, y_pos))
         
         # Draw overlays
         draw_scanlines(screen)
@@ -2,9 +2,10 @@
 import pygame
 from pathlib import Path
 from scene_manager import Scene, register_scene
-from utils import get_font, draw_scanlines, draw_footer, render_text, load_icon, launch_command, ROOT
+from utils import get_matrix_green, draw_scanlines, draw_footer, render_text, load_icon, launch_command, ROOT
 from intent_router import Intents
 from renderers import FrameState, Shape, Text, Image
+from renderers.frame_state import ShapeType
 
 
 @register_scene("MenuScene")
@@ -17,6 +18,7 @@ class MenuScene(Scene):
         self.bg = (0, 0, 0)
         self.icons = []
         self.entries = []
+        self.labels = []
         self.title = ""
         
         # Layout vars
@@ -27,32 +29,50 @@ class MenuScene(Scene):
         self.top = 0
         self.icon_pad = 0
         self.icon_size = (0, 0)
+        self.card_rects = []  # One pygame.Rect per entry, for drawing and hit-testing
+        self._layout_key = None  # (width, height, entry count) the geometry was computed for
         self.title_font_size = 28
         self.item_font_size = 22
+        
+        # Scenes are constructed on the preload worker thread; lay out and
+        # decode the icons there so the first on_enter hits the icon cache
+        self._compute_layout()
     
     def on_enter(self):
         """Initialize menu display."""
-        from utils import get_matrix_green
+        self._compute_layout()
+    
+    def _compute_layout(self):
+        """Read menu config, lay out the cards and load the (cached) icons."""
         cfg = self.manager.config
         self.color = get_matrix_green(cfg)
         self.title = cfg["menu"].get("title", "Select an option:")
         self.entries = cfg["menu"].get("entries", [])
+        self.labels = [e.get("label", f"Option {i+1}") for i, e in enumerate(self.entries)]
         
+        # Card geometry only depends on the screen size and entry count
         w, h = self.manager.screen.get_size()
-        self.title_font_size = max(28, int(h * 0.05))
-        self.item_font_size = max(22, int(h * 0.035))
-        
-        # Layout 3 columns
-        self.margin = int(w * 0.08)
-        self.gutter = int(w * 0.04)
-        self.card_w = (w - self.margin * 2 - self.gutter * 2) // 3
-        self.card_h = int(h * 0.45)
-        self.top = int(h * 0.25)
-        
-        self.icon_pad = int(self.card_w * 0.1)
-        self.icon_size = (self.card_w - 2 * self.icon_pad, int(self.card_h * 0.55))
+        layout_key = (w, h, len(self.entries))
+        if layout_key != self._layout_key:
+            self._layout_key = layout_key
+            self.title_font_size = max(28, int(h * 0.05))
+            self.item_font_size = max(22, int(h * 0.035))
+            
+            # Layout 3 columns
+            self.margin = int(w * 0.08)
+            self.gutter = int(w * 0.04)
+            self.card_w = (w - self.margin * 2 - self.gutter * 2) // 3
+            self.card_h = int(h * 0.45)
+            self.top = int(h * 0.25)
+            
+            self.icon_pad = int(self.card_w * 0.1)
+            self.icon_size = (self.card_w - 2 * self.icon_pad, int(self.card_h * 0.55))
+            self.card_rects = [
+                pygame.Rect(self.margin + i * (self.card_w + self.gutter), self.top, self.card_w, self.card_h)
+                for i in range(len(self.entries))
+            ]
         
-        # Load icons
+        # Load icons (cached; re-read only if a file changed on disk)
         self.icons = []
         for e in self.entries:
             icon_path = ROOT / e.get("icon", "")
@@ -107,9 +127,7 @@ class MenuScene(Scene):
             pos = self.get_event_position(event)
             if pos:
                 mx, my = pos
-                for i in range(3):
-                    x = self.margin + i * (self.card_w + self.gutter)
-                    rect = pygame.Rect(x, self.top, self.card_w, self.card_h)
+                for i, rect in enumerate(self.card_rects):
                     if rect.collidepoint(mx, my):
                         self.ctx.intent_router.emit(Intents.SELECT_OPTION, index=i)
                         return True
@@ -143,8 +161,8 @@ class MenuScene(Scene):
         ))
         
         # Draw menu cards
-        for i, e in enumerate(self.entries):
-            x = self.margin + i * (self.card_w + self.gutter)
+        for i, label in enumerate(self.labels):
+            x = self.card_rects[i].x
             
             # Card background
             frame.add_shape(Shape.rect(
@@ -189,7 +207,7 @@ class MenuScene(Scene):
                 ))
                 # Placeholder text
                 frame.add_text(Text.create(
-                    content=e.get("label", f"Option {i+1}"),
+                    content=label,
                     x=icon_x + 8,
                     y=icon_y + self.icon_size[1] // 2 - 12,
                     color=self.color,
@@ -198,7 +216,6 @@ class MenuScene(Scene):
                 ))
             
             # Label at bottom
-            label = e.get("label", f"Option {i+1}")
             frame.add_text(Text.create(
                 content=label,
                 x=x + self.icon_pad,
@@ -217,8 +234,6 @@ class MenuScene(Scene):
     
     def _render_frame_compat(self, screen, frame):
         """Temporary: render frame state using pygame (backward compat)."""
-        from renderers.frame_state import ShapeType
-        
         screen.fill(frame.clear_color)
         
         # Render shapes
@@ -229,13 +244,17 @@ class MenuScene(Scene):
                 w, h = shape.size
                 pygame.draw.rect(screen, color, (int(x), int(y), int(w), int(h)), shape.thickness)
         
+        # Images then text, composited in a single blits call
+        blit_list = []
+        
         # Render images
         for image in frame.images:
-            screen.blit(image.surface, (int(image.position[0]), int(image.position[1])))
+            blit_list.append((image.surface, (int(image.position[0]), int(image.position[1]))))
         
         # Render text
         for text in frame.texts:
-            font = get_font(text.font_size, mono=(text.font_family == "monospace"))
             color = text.color[:3]
-            surface = font.render(text.content, True, color)
-            screen.blit(surface, (int(text.position[0]), int(text.position[1])))
+            surface = render_text(text.content, text.font_size, mono=(text.font_family == "monospace"), color=color)
+            blit_list.append((surface, (int(text.position[0]), int(text.position[1]))))
+        
+        screen.blits(blit_list, doreturn=False)
@@ -2,8 +2,9 @@
 import time
 import pygame
 from scene_manager import Scene, register_scene
-from utils import get_font, get_matrix_green
+from utils import get_matrix_green, dim_color, render_text
 from renderers import FrameState, Shape, Text
+from renderers.frame_state import ShapeType
 
 
 @register_scene("SplashScene")
@@ -17,12 +18,16 @@ class SplashScene(Scene):
         self._start = 0.0
         self._min_secs = ctx.config.get('splash_min_seconds', 1.0) if hasattr(ctx, 'config') else 1.0
         self.color = (140, 255, 140)
+        self.border_color = (70, 127, 70)
+        self.title = 'NRHOF kiosk'
     
     def on_enter(self):
         """Initialize splash screen."""
         self._start = time.time()
         self.progress = 0.0
         self.color = get_matrix_green(self.manager.config)
+        self.border_color = dim_color(self.color)
+        self.title = self.manager.config.get('title', 'NRHOF kiosk')
     
     def on_exit(self):
         """Clean up splash screen."""
@@ -58,9 +63,8 @@ class SplashScene(Scene):
         center_y = h // 2
         
         # Title text
-        title = self.manager.config.get('title', 'NRHOF kiosk')
         frame.add_text(Text.create(
-            content=title,
+            content=self.title,
             x=center_x,
             y=center_y - 60,
             color=self.color,
@@ -88,13 +92,12 @@ class SplashScene(Scene):
         bar_y = center_y + 60
         
         # Border
-        border_color = tuple(int(c * 0.5) for c in self.color)
         frame.add_shape(Shape.rect(
             x=bar_x,
             y=bar_y,
             w=bar_width,
             h=bar_height,
-            color=border_color,
+            color=self.border_color,
             thickness=2
         ))
         
@@ -115,26 +118,25 @@ class SplashScene(Scene):
         screen.fill(frame.clear_color)
         for shape in frame.shapes:
             self._render_shape_compat(screen, shape)
-        for text in frame.texts:
-            self._render_text_compat(screen, text)
+        screen.blits([self._render_text_compat(text) for text in frame.texts], doreturn=False)
     
     def _render_shape_compat(self, screen, shape):
         """Temporary: render shape using pygame (backward compat)."""
-        from renderers.frame_state import ShapeType
         color = shape.color[:3]
         if shape.shape_type == ShapeType.RECT:
             x, y = shape.position
             w, h = shape.size
             pygame.draw.rect(screen, color, (int(x), int(y), int(w), int(h)), shape.thickness)
     
-    def _render_text_compat(self, screen, text):
-        """Temporary: render text using pygame (backward compat)."""
-        font = get_font(text.font_size, mono=(text.font_family == "monospace"))
+    def _render_text_compat(self, text):
+        """Temporary: render text using pygame (backward compat).
+        
+        Returns:
+            (surface, destination) pair for Surface.blits
+        """
         color = text.color[:3]
-        surface = font.render(text.content, True, color)
+        surface = render_text(text.content, text.font_size, mono=(text.font_family == "monospace"), color=color)
         x, y = text.position
         if text.align == "center":
-            rect = surface.get_rect(center=(int(x), int(y)))
-            screen.blit(surface, rect)
-        else:
-            screen.blit(surface, (int(x), int(y)))
\ No newline at end of file
+            return surface, surface.get_rect(center=(int(x), int(y)))
+        return surface, (int(x), int(y))
\ No newline at end of file
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 import os
-from pathlib import Path
 from scene_manager import BaseHubScene, register_scene
 from intent_router import Intents
+from utils import VIDEOS_DIR
 
 
 @register_scene("VideoListScene")
@@ -11,12 +11,11 @@ class VideoListScene(BaseHubScene):
     
     def __init__(self, ctx):
         # Scan for video files in assets/videos/
-        video_dir = Path(__file__).parent.parent / "assets" / "videos"
         video_files = []
         
-        if video_dir.exists():
+        if VIDEOS_DIR.exists():
             # Find all MP4 files
-            for video_file in sorted(video_dir.glob("*.mp4")):
+            for video_file in sorted(VIDEOS_DIR.glob("*.mp4")):
                 video_files.append({
                     "label": video_file.stem,  # Filename without extension
                     "id": f"video:{video_file.name}"  # Store full filename
@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
+import threading
+import time
 import pygame
 from pathlib import Path
 from scene_manager import Scene, register_scene
 from intent_router import Intents
 from renderers import FrameState, Video, Text
+from utils import VIDEOS_DIR, get_font
 
 
 @register_scene("VideoPlayerScene")
@@ -19,8 +22,18 @@ class VideoPlayerScene(Scene):
         self.cap = None
         self.use_opencv = False
         self.current_frame = None
-        self.frame_time = 0
         self.video_fps = 30  # Default FPS
+        
+        # Decoded RGB frames, double-buffered between the decode thread and the render loop
+        self._frames = [None, None]
+        self._ready_idx = 0
+        self._decoding = False
+        self._decode_thread = None
+        self._target_size = None  # Screen size frames are resized to on the decode thread
+        
+        # Scaled surface for the frame last drawn; rebuilt only when a new frame arrives
+        self._frame_surface = None
+        self._surface_frame = None
     
     def on_enter(self):
         """Load and start playing the video."""
@@ -31,7 +44,7 @@ class VideoPlayerScene(Scene):
             print("No video file specified")
             return
         
-        video_path = Path(__file__).parent.parent / "assets" / "videos" / video_filename
+        video_path = VIDEOS_DIR / video_filename
         
         if not video_path.exists():
             print(f"Video not found: {video_path}")
@@ -77,21 +90,73 @@ class VideoPlayerScene(Scene):
             self.playing = True
             self.video_finished = False
             self.use_opencv = True
-            self.frame_time = 0
             print(f"Video FPS: {self.video_fps}")
+            
+            # Decode (and resize to the screen) on a background thread so the
+            # render loop only presents frames
+            self._target_size = self.manager.screen.get_size()
+            self._frames = [None, None]
+            self._ready_idx = 0
+            self._decoding = True
+            self._decode_thread = threading.Thread(target=self._decode_loop, daemon=True, name="VideoDecoder")
+            self._decode_thread.start()
         except ImportError:
             print("OpenCV not available. Install with: pip install opencv-python")
             self.playing = False
             self.video_finished = True
     
+    def _decode_loop(self):
+        """Read and convert frames at the video's frame rate (runs in background thread)."""
+        import cv2
+        
+        frame_duration = 1.0 / self.video_fps
+        next_time = time.monotonic()
+        back_idx = 1
+        
+        while self._decoding:
+            ret, frame = self.cap.read()
+            if not ret:
+                # Video finished; the render loop handles navigation
+                self.video_finished = True
+                break
+            
+            # Resize off the render thread; OpenCV's resize is SIMD-vectorized
+            if (frame.shape[1], frame.shape[0]) != self._target_size:
+                frame = cv2.resize(frame, self._target_size, interpolation=cv2.INTER_LINEAR)
+            
+            # Fill the back buffer, then publish it with a single index swap
+            self._frames[back_idx] = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+            self._ready_idx = back_idx
+            back_idx ^= 1
+            
+            # Pace decoding to the video frame rate
+            next_time += frame_duration
+            delay = next_time - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Fell behind; resync instead of bursting to catch up
+                next_time = time.monotonic()
+    
     def on_exit(self):
         """Clean up video resources."""
         if hasattr(self, 'movie') and self.movie:
             self.movie.stop()
             self.movie = None
         
-        if hasattr(self, 'cap'):
+        # Stop the decode thread before releasing the capture it reads from
+        self._decoding = False
+        if self._decode_thread:
+            self._decode_thread.join(timeout=1.0)
+            self._decode_thread = None
+        
+        if self.cap:
             self.cap.release()
+            self.cap = None
+        self.use_opencv = False
+        self.current_frame = None
+        self._frame_surface = None
+        self._surface_frame = None
     
     def handle_event(self, event: pygame.event.Event):
         """Handle input events."""
@@ -118,22 +183,14 @@ class VideoPlayerScene(Scene):
     
     def update(self, dt: float):
         """Update video playback."""
-        # Update frame timing for OpenCV playback
-        if self.use_opencv and self.cap and self.cap.isOpened():
-            self.frame_time += dt
-            frame_duration = 1.0 / self.video_fps
+        # OpenCV playback: pick up the latest frame published by the decode thread
+        if self.use_opencv and self.cap:
+            if self.video_finished:
+                # Video finished
+                self.ctx.intent_router.emit(Intents.GO_HOME)
+                return
             
-            # Only read a new frame if enough time has passed
-            if self.frame_time >= frame_duration:
-                self.frame_time = 0
-                ret, frame = self.cap.read()
-                if ret:
-                    # Store the frame for drawing
-                    self.current_frame = frame
-                else:
-                    # Video finished
-                    self.video_finished = True
-                    self.ctx.intent_router.emit(Intents.GO_HOME)
+            self.current_frame = self._frames[self._ready_idx]
         
         elif self.movie and not self.movie.get_busy():
             # Movie finished
@@ -148,19 +205,26 @@ class VideoPlayerScene(Scene):
         screen_size = screen.get_size()
         
         if self.use_opencv and self.current_frame is not None:
-            # Convert OpenCV frame to pygame surface
-            import cv2
-            import numpy as np
-            
-            frame = cv2.cvtColor(self.current_frame, cv2.COLOR_BGR2RGB)
-            frame = np.rot90(frame)
-            frame_surface = pygame.surfarray.make_surface(frame)
-            
-            # Scale to fit screen
-            frame_surface = pygame.transform.scale(frame_surface, screen_size)
+            # The render loop runs faster than the video, so only convert each
+            # decoded frame once (holding the reference keeps the identity check safe)
+            if (self.current_frame is not self._surface_frame
+                    or self._frame_surface.get_size() != screen_size):
+                # Wrap the contiguous (h, w, 3) RGB frame from the decode thread
+                # without copying; convert() below makes the only copy
+                frame = self.current_frame
+                frame_surface = pygame.image.frombuffer(frame, (frame.shape[1], frame.shape[0]), "RGB")
+                
+                # Frames arrive screen-sized from the decode thread; only rescale
+                # if the screen changed since playback started
+                if frame_surface.get_size() != screen_size:
+                    frame_surface = pygame.transform.scale(frame_surface, screen_size)
+                
+                # Store in the display's pixel format for a fast blit
+                self._frame_surface = frame_surface.convert()
+                self._surface_frame = self.current_frame
             
             # Draw directly (video frames are already surfaces)
-            screen.blit(frame_surface, (0, 0))
+            screen.blit(self._frame_surface, (0, 0))
         
         elif self.movie_screen:
             # Draw pygame.movie frame
@@ -168,8 +232,6 @@ class VideoPlayerScene(Scene):
         
         else:
             # Show error message using renderer abstraction
-            from utils import get_font
-            
             font = get_font(48)
             text = font.render("Video player not available", True, (0, 255, 0))
             text_rect = text.get_rect(center=(screen_size[0] // 2, screen_size[1] // 2))
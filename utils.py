@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import os
+import json
 import math
 import subprocess
 from pathlib import Path
@@ -9,15 +10,13 @@ from functools import lru_cache
 import numpy as np
 import pygame
 from pygame import Surface
-from PIL import Image
 
-try:
-    import cairosvg  # type: ignore
-    HAVE_CAIROSVG = True
-except Exception:
-    HAVE_CAIROSVG = False
+# PIL and cairosvg are only needed to load icons; they are imported on first use
+# (see load_icon) so modules that just want fonts/drawing helpers don't pay for them.
 
 ROOT = Path(__file__).resolve().parent
+ASSETS_DIR = ROOT / "assets"
+VIDEOS_DIR = ASSETS_DIR / "videos"
 
 # Screen margin constants - safe zones where content should not be drawn
 FOOTER_HEIGHT = 50  # pixels from bottom of screen
@@ -58,15 +57,28 @@ def dim_color(color: tuple, factor: float = 0.5) -> tuple:
     return tuple(int(c * factor) for c in color)
 
 
+# Scanline overlays by (width, height, strength); built once, blitted every frame
+_scanline_cache: dict[tuple, Surface] = {}
+
+
 def draw_scanlines(surface: Surface, strength: float = 0.15):
     w, h = surface.get_size()
-    scan = pygame.Surface((w, h), pygame.SRCALPHA)
-    dark = int(255 * strength)
-    for y in range(0, h, 2):
-        pygame.draw.line(scan, (0, 0, 0, dark), (0, y), (w, y))
+    key = (w, h, strength)
+    scan = _scanline_cache.get(key)
+    if scan is None:
+        scan = pygame.Surface((w, h), pygame.SRCALPHA)
+        dark = int(255 * strength)
+        for y in range(0, h, 2):
+            pygame.draw.line(scan, (0, 0, 0, dark), (0, y), (w, y))
+        _scanline_cache[key] = scan
     surface.blit(scan, (0, 0), special_flags=pygame.BLEND_SUB)
 
 
+# Rendered back-arrow text and (dim color, footer text) by color; static, so render once
+_back_arrow_cache: dict[tuple, Surface] = {}
+_footer_cache: dict[tuple, tuple[tuple, Surface]] = {}
+
+
 def draw_back_arrow(surface: Surface, color: tuple = (140, 255, 140)) -> pygame.Rect:
     """Draw a back arrow in the top-left corner.
     
@@ -77,13 +89,16 @@ def draw_back_arrow(surface: Surface, color: tuple = (140, 255, 140)) -> pygame.
     Returns:
         pygame.Rect: Clickable area for the back arrow
     """
-    # Dim the color slightly for subtle appearance
-    arrow_color = tuple(int(c * 0.8) for c in color)
-    
-    # Draw back arrow text
-    font = get_font(24)
-    arrow_text = "< back"
-    text_surface = font.render(arrow_text, True, arrow_color)
+    text_surface = _back_arrow_cache.get(color)
+    if text_surface is None:
+        # Dim the color slightly for subtle appearance
+        arrow_color = tuple(int(c * 0.8) for c in color)
+        
+        # Render back arrow text
+        font = get_font(24)
+        arrow_text = "< back"
+        text_surface = font.render(arrow_text, True, arrow_color)
+        _back_arrow_cache[color] = text_surface
     
     # Position in top-left with margins
     x = MARGIN_LEFT
@@ -104,17 +119,22 @@ def draw_footer(surface: Surface, color: tuple = (140, 255, 140)):
     """
     w, h = surface.get_size()
     
-    # Dim the color for subtle appearance
-    dim_color = tuple(c // 4 for c in color)
+    # Dim color and footer text are derived once per color
+    cached = _footer_cache.get(color)
+    if cached is None:
+        # Dim the color for subtle appearance
+        dim_color = tuple(c // 4 for c in color)
+        font = get_font(16)  # Increased from 14
+        footer_text = "big nerd industries inc. ©2025"
+        cached = (dim_color, font.render(footer_text, True, dim_color))
+        _footer_cache[color] = cached
+    dim_color, text_surface = cached
     
     # Draw horizontal line separator
     line_y = h - FOOTER_HEIGHT + 5
     pygame.draw.line(surface, dim_color, (20, line_y), (w - 20, line_y), 1)
     
     # Draw footer text
-    font = get_font(16)  # Increased from 14
-    footer_text = "big nerd industries inc. ©2025"
-    text_surface = font.render(footer_text, True, dim_color)
     text_rect = text_surface.get_rect()
     text_rect.centerx = w // 2
     text_rect.bottom = h - 12
@@ -134,17 +154,76 @@ def vignette(surface: Surface, strength: float = 0.6):
     surface.blit(vg, (0, 0))
 
 
+@lru_cache(maxsize=1)
+def _get_cairosvg():
+    """Import cairosvg on first use.
+    
+    Returns:
+        The cairosvg module, or None if it isn't available
+    """
+    try:
+        import cairosvg  # type: ignore
+        return cairosvg
+    except Exception:
+        return None
+
+
 def load_icon(path: Path, size: tuple[int, int]) -> Surface | None:
+    """Load an SVG/raster icon scaled to size.
+    
+    Results are cached by (path, mtime, size), so re-entering a scene reuses
+    the decoded surface instead of re-rasterizing it, while an edited icon
+    file is picked up on the next load. Callers must not draw onto the
+    returned surface.
+    
+    Args:
+        path: Icon file path
+        size: Target (width, height) in pixels
+        
+    Returns:
+        Icon surface, or None if it could not be loaded
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_icon_cached(path, mtime_ns, size)
+
+
+def evict_icon_cache():
+    """Drop all cached icon surfaces."""
+    _load_icon_cached.cache_clear()
+
+
+@lru_cache(maxsize=32)
+def _load_icon_cached(path: Path, mtime_ns: int | None, size: tuple[int, int]) -> Surface | None:
+    """Decode an icon (cached; see load_icon). mtime_ns is only part of the key."""
     try:
-        if path.suffix.lower() == ".svg" and HAVE_CAIROSVG:
+        from PIL import Image
+        
+        cairosvg = _get_cairosvg() if path.suffix.lower() == ".svg" else None
+        if cairosvg:
             png_bytes = cairosvg.svg2png(url=str(path), output_width=size[0], output_height=size[1])
             pil_img = Image.open(BytesIO(png_bytes)).convert("RGBA")
         else:
-            pil_img = Image.open(path).convert("RGBA")
-        pil_img = pil_img.resize(size, Image.LANCZOS)
+            pil_img = Image.open(path)
+            # JPEGs can decode straight to a reduced scale (>= size) instead of full resolution
+            if pil_img.format == "JPEG":
+                pil_img.draft("RGB", size)
+            pil_img = pil_img.convert("RGBA")
+        # cairosvg already rasterizes at the target size; only resample if needed
+        if pil_img.size != tuple(size):
+            pil_img = pil_img.resize(size, Image.LANCZOS)
         mode = pil_img.mode
         data = pil_img.tobytes()
-        return pygame.image.fromstring(data, pil_img.size, mode)
+        # frombuffer wraps the bytes instead of copying them again like fromstring
+        icon = pygame.image.frombuffer(data, pil_img.size, mode)
+        try:
+            icon = icon.convert_alpha()
+        except pygame.error:
+            # No display mode set yet
+            pass
+        return icon
     except Exception:
         return None
 
@@ -160,33 +239,71 @@ def launch_command(cmd: str):
 # ---------------- Font helpers (centralized) ----------------
 
 # Preferred fonts (mono first for "matrix" look, then common mac/win fallbacks)
-_MONO_FONT_CANDIDATES = [
+_MONO_FONT_CANDIDATES = (
     "DejaVu Sans Mono",  # present on Raspberry Pi via fonts-dejavu-core
     "Menlo",             # macOS default mono
     "Courier New",       # Windows common mono
     "Liberation Mono",   # Linux common
-]
+)
 
-_SANS_FONT_CANDIDATES = [
+_SANS_FONT_CANDIDATES = (
     "DejaVu Sans",
     "Arial",
     "Liberation Sans",
-]
+)
 
 def _first_available_font(candidates):
-    """Return the first available font name from the candidate list."""
+    """Return the file path of the first installed font from the candidate list."""
     for name in candidates:
         try:
-            # SysFont returns a Font even if it needs to map; we still prefer ordered list
-            f = pygame.font.SysFont(name, 12)
-            if isinstance(f, pygame.font.Font):
-                return name
+            # match_font returns None for names that aren't installed (SysFont would
+            # silently fall back to the default font instead)
+            path = pygame.font.match_font(name)
+            if path:
+                return path
         except Exception:
             pass
     # As a last resort, None lets pygame pick a default
     return None
 
-@lru_cache(maxsize=64)
+# First available font file by (mono, prefer); None means pygame's default
+_RESOLVED_FONT_PATHS: dict[tuple, str | None] = {}
+
+# Resolved font files persisted across runs, so later starts skip the system font scan
+FONT_RESOLUTION_CACHE = Path.home() / ".cache" / "nrhof" / "font_resolution.json"
+_disk_font_paths: dict[str, str] | None = None
+
+def _cached_font_path(mono: bool, prefer: str | None) -> str | None:
+    """Return a previously resolved font file from disk, if it still exists."""
+    global _disk_font_paths
+    if _disk_font_paths is None:
+        try:
+            data = json.loads(FONT_RESOLUTION_CACHE.read_text())
+        except (OSError, ValueError):
+            data = None
+        # Anything but a JSON object (e.g. null or a list) is treated as an empty cache
+        _disk_font_paths = data if isinstance(data, dict) else {}
+    path = _disk_font_paths.get(f"{mono}|{prefer or ''}")
+    if isinstance(path, str) and os.path.isfile(path):
+        return path
+    return None
+
+def _store_font_path(mono: bool, prefer: str | None, path: str):
+    """Persist a font file confirmed by match_font (best effort)."""
+    global _disk_font_paths
+    if _disk_font_paths is None:
+        _disk_font_paths = {}
+    _disk_font_paths[f"{mono}|{prefer or ''}"] = path
+    try:
+        FONT_RESOLUTION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        FONT_RESOLUTION_CACHE.write_text(json.dumps(_disk_font_paths))
+    except OSError:
+        pass
+
+# Fonts by resolved (font file, size); candidate lists that land on the same file share
+# one Font. A plain dict since the working set is small and never evicted
+_FONT_CACHE: dict[tuple, pygame.font.Font] = {}
+
 def get_font(size: int = 24, *, mono: bool = True, prefer: str | None = None) -> pygame.font.Font:
     """
     Centralized font getter with caching and sane fallbacks.
@@ -194,32 +311,80 @@ def get_font(size: int = 24, *, mono: bool = True, prefer: str | None = None) ->
     - mono: True picks monospaced candidates; False picks sans candidates
     - prefer: exact font name to try first (optional)
     """
-    try:
-        pygame.font.get_init() or pygame.font.init()
-    except Exception:
-        # Will be initialized by pygame.init() elsewhere, but we try anyway
-        pass
+    chosen = _resolve_font_path(mono, prefer)
+    key = (chosen, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            # None → default font
+            font = pygame.font.Font(chosen, size)
+        except Exception:
+            # Final fallback: default font (e.g. the cached file is unreadable)
+            font = pygame.font.Font(None, size)
+        _FONT_CACHE[key] = font
+    return font
+
+# Set once pygame.font has been confirmed initialized, so loads skip the probe
+_font_ready = False
+
+def _resolve_font_path(mono: bool, prefer: str | None) -> str | None:
+    """Resolve the font file for (mono, prefer); None means pygame's default font."""
+    # Candidate scan result is the same for every size; resolve once per (mono, prefer)
+    path_key = (mono, prefer)
+    if path_key in _RESOLVED_FONT_PATHS:
+        return _RESOLVED_FONT_PATHS[path_key]
+
+    global _font_ready
+    if not _font_ready:
+        try:
+            pygame.font.get_init() or pygame.font.init()
+            _font_ready = True
+        except Exception:
+            # Will be initialized by pygame.init() elsewhere, but we try anyway
+            pass
 
-    # Build ordered list
-    candidates = []
-    if prefer:
-        candidates.append(prefer)
-    candidates.extend(_MONO_FONT_CANDIDATES if mono else _SANS_FONT_CANDIDATES)
+    chosen = _cached_font_path(mono, prefer)
+    if chosen is None:
+        # Build ordered list
+        candidates = _MONO_FONT_CANDIDATES if mono else _SANS_FONT_CANDIDATES
+        if prefer:
+            candidates = (prefer,) + candidates
 
-    chosen = _first_available_font(candidates)
-    try:
+        chosen = _first_available_font(candidates)
         if chosen:
-            return pygame.font.SysFont(chosen, size)
-        # None → default font
-        return pygame.font.SysFont(None, size)
-    except Exception:
-        # Final fallback: constructed Font (rarely needed)
-        return pygame.font.Font(None, size)
+            _store_font_path(mono, prefer, chosen)
+    _RESOLVED_FONT_PATHS[path_key] = chosen
+    return chosen
+
+# Fixed sizes used by shared chrome and hub scenes (footer, help, back arrow, items, titles)
+COMMON_FONT_SIZES = (16, 18, 24, 32, 48)
+
+def preload_fonts(sizes=COMMON_FONT_SIZES, *, mono: bool = True) -> None:
+    """Populate the font cache for the given sizes up front.
+    
+    Args:
+        sizes: Point sizes to load
+        mono: Font family to load (see get_font)
+    """
+    for size in sizes:
+        get_font(size, mono=mono)
 
+@lru_cache(maxsize=256)
 def render_text(text: str, size: int = 24, *, mono: bool = True, color=(0, 255, 0), antialias=True, prefer: str | None = None) -> pygame.Surface:
-    """Convenience: get a font and render one line of text to a surface."""
+    """Convenience: get a font and render one line of text to a surface.
+    
+    Surfaces are cached by all arguments (color must be a tuple), so static
+    labels drawn every frame are rasterized once. Don't draw onto the result.
+    """
     font = get_font(size, mono=mono, prefer=prefer)
-    return font.render(text, antialias, color)
+    surface = font.render(text, antialias, color)
+    # Match the display format once here rather than on every blit of the cached surface
+    try:
+        surface = surface.convert_alpha()
+    except pygame.error:
+        # No display mode set yet
+        pass
+    return surface
 
 def measure_text(text: str, size: int = 24, *, mono: bool = True, prefer: str | None = None) -> tuple[int, int]:
     """Return (width, height) for a string at a given size."""
@@ -6,6 +6,10 @@ from .base import Visualizer
 from utils import MARGIN_TOP, MARGIN_LEFT, MARGIN_RIGHT, MARGIN_BOTTOM
 from renderers import FrameState, Shape
 
+# The curve repeats when both phase (x) and phase * 1.3 (y) advance by whole
+# turns, i.e. every 20*pi of phase.
+PHASE_PERIOD = 20.0 * math.pi
+
 
 class LissajousVisualizer(Visualizer):
     """Lissajous parametric curve visualizer."""
@@ -26,7 +30,12 @@ class LissajousVisualizer(Visualizer):
         
         # Persistent phosphor fade
         self.phosphor_surface = None
+        self.fade_surface = None
         self.fade_alpha = 15
+        
+        # Curve parameter samples and warp envelope are fixed, compute once
+        self._t = np.linspace(0.0, 2 * math.pi, self.num_points, endpoint=False)
+        self._warp_wave = np.sin(self._t * 2)
     
     def reset(self):
         """Reset visualizer state."""
@@ -57,21 +66,26 @@ class LissajousVisualizer(Visualizer):
         
         # Update phase
         self.phase += self.spin_speed * self.spin_multiplier * dt * 60
+        
+        # Keep phase bounded without a float modulo every frame
+        if self.phase >= PHASE_PERIOD:
+            self.phase -= PHASE_PERIOD
     
     def draw(self, surface: pygame.Surface):
         """Draw the Lissajous curve."""
         w, h = surface.get_size()
         
-        # Initialize phosphor surface if needed
+        # Initialize phosphor and fade surfaces if needed
         if self.phosphor_surface is None:
             self.phosphor_surface = pygame.Surface((w, h))
             self.phosphor_surface.fill((0, 0, 0))
+        if self.fade_surface is None or self.fade_surface.get_size() != (w, h):
+            self.fade_surface = pygame.Surface((w, h))
+            self.fade_surface.fill((0, 0, 0))
+            self.fade_surface.set_alpha(self.fade_alpha)
         
         # Apply phosphor fade
-        fade_surface = pygame.Surface((w, h))
-        fade_surface.fill((0, 0, 0))
-        fade_surface.set_alpha(self.fade_alpha)
-        self.phosphor_surface.blit(fade_surface, (0, 0))
+        self.phosphor_surface.blit(self.fade_surface, (0, 0))
         
         # Calculate center and scale
         center_x = w // 2
@@ -80,24 +94,20 @@ class LissajousVisualizer(Visualizer):
         usable_height = h - MARGIN_TOP - MARGIN_BOTTOM
         scale = min(usable_width, usable_height) * 0.35
         
-        # Generate parametric points
-        points = []
-        for i in range(self.num_points):
-            t = (i / self.num_points) * 2 * math.pi
-            
-            # Spherical harmonic equations
-            x_base = math.sin(self.param_a * t + self.phase)
-            y_base = math.sin(self.param_b * t + self.phase * 1.3)
-            
-            # Apply audio-reactive warp
-            warp_factor = 1.0 + self.warp_amount * math.sin(t * 2)
-            x = x_base * warp_factor
-            y = y_base * warp_factor
-            
-            # Scale to screen coordinates
-            screen_x = int(center_x + x * scale)
-            screen_y = int(center_y + y * scale)
-            points.append((screen_x, screen_y))
+        # Generate parametric points (vectorized over all samples)
+        t = self._t
+        
+        # Spherical harmonic equations
+        x_base = np.sin(self.param_a * t + self.phase)
+        y_base = np.sin(self.param_b * t + self.phase * 1.3)
+        
+        # Apply audio-reactive warp
+        warp_factor = 1.0 + self.warp_amount * self._warp_wave
+        
+        # Scale to screen coordinates
+        screen_x = (center_x + x_base * warp_factor * scale).astype(np.int32)
+        screen_y = (center_y + y_base * warp_factor * scale).astype(np.int32)
+        points = np.column_stack((screen_x, screen_y)).tolist()
         
         # Draw polyline on phosphor surface
         if len(points) > 1:
@@ -15,13 +15,17 @@ class SpectrumBarsVisualizer(Visualizer):
         # Read from config with defaults
         self.num_bins = config.get('spectrum_bars', 128)
         self.decay_rate = config.get('spectrum_decay', 0.85)
-        self.bar_heights = [0] * self.num_bins
+        self.bar_heights = np.zeros(self.num_bins, dtype=np.float32)
         self.bar_width = 10
         self.bar_spacing = 2
+        
+        # Bin -> bar resampling indices, rebuilt only when the FFT length changes
+        self._resample_len = None
+        self._resample_idx = None
     
     def reset(self):
         """Reset visualizer state."""
-        self.bar_heights = [0] * self.num_bins
+        self.bar_heights = np.zeros(self.num_bins, dtype=np.float32)
     
     def update(self, audio_data: dict, dt: float):
         """Update spectrum bars based on FFT data."""
@@ -30,13 +34,14 @@ class SpectrumBarsVisualizer(Visualizer):
         if fft_bins is not None and len(fft_bins) > 0:
             # Resample FFT to match number of bars
             if len(fft_bins) != self.num_bins:
-                indices = np.linspace(0, len(fft_bins) - 1, self.num_bins).astype(int)
-                fft_bins = fft_bins[indices]
+                if self._resample_len != len(fft_bins):
+                    self._resample_idx = np.linspace(0, len(fft_bins) - 1, self.num_bins).astype(int)
+                    self._resample_len = len(fft_bins)
+                fft_bins = fft_bins[self._resample_idx]
             
-            # Apply smoothing with configurable decay
-            for i in range(self.num_bins):
-                target = fft_bins[i]
-                self.bar_heights[i] += (target - self.bar_heights[i]) * (1.0 - self.decay_rate)
+            # Apply smoothing with configurable decay (decay_rate is per 60 Hz frame)
+            blend = 1.0 - self.decay_rate ** (dt * 60)
+            self.bar_heights += (fft_bins - self.bar_heights) * blend
     
     def draw(self, surface: pygame.Surface):
         """Draw spectrum bars using renderer abstraction."""
@@ -50,8 +55,8 @@ class SpectrumBarsVisualizer(Visualizer):
         self.bar_width = max(2, total_width // self.num_bins - self.bar_spacing)
         
         # Draw bars directly (backward compat)
-        for i, height in enumerate(self.bar_heights):
-            bar_height = int(height * usable_height * 0.8)
+        bar_px = (self.bar_heights * (usable_height * 0.8)).astype(np.int32).tolist()
+        for i, bar_height in enumerate(bar_px):
             x = MARGIN_LEFT + i * (self.bar_width + self.bar_spacing)
             y = h - MARGIN_BOTTOM - bar_height
             
@@ -7,6 +7,9 @@ from .base import Visualizer
 from utils import MARGIN_TOP, MARGIN_LEFT, MARGIN_RIGHT, MARGIN_BOTTOM
 from renderers import FrameState, Shape
 
+# Per-frame (60 Hz) amplitude decay applied while there is no audio
+SILENCE_DECAY = 0.9
+
 
 class WaveformVisualizer(Visualizer):
     """Flowing waveform visualizer with glow effects and particles."""
@@ -18,6 +21,11 @@ class WaveformVisualizer(Visualizer):
         self.num_waves = config.get('waveform_num_waves', 5)
         self.wave_points = config.get('waveform_points', 300)
         self.time_offset = 0
+        
+        # Sample positions along the wave are fixed; precompute them once
+        self._x_ratio = np.arange(self.wave_points) / self.wave_points
+        self._x_phase = self._x_ratio * math.pi * 2
+        
         self.wave_speed = config.get('waveform_speed', 0.03)
         
         # Amplitude tracking - start at zero
@@ -27,7 +35,7 @@ class WaveformVisualizer(Visualizer):
         
         # Frequency bands - start at zero
         self.freq_bands = config.get('waveform_freq_bands', 8)
-        self.band_amplitudes = [0.0] * self.freq_bands
+        self.band_amplitudes = np.zeros(self.freq_bands)
         
         # Particles for extra flair
         self.particles = []
@@ -35,13 +43,37 @@ class WaveformVisualizer(Visualizer):
         
         # Glow surface for bloom effect
         self.glow_surface = None
+        self.glow_dirty = None  # Area of glow_surface drawn last frame
+        
+        # Per-wave (thick glow, medium glow, main line) RGBA colors, faded by wave index
+        self.wave_colors = self._build_wave_colors()
+        
+        # Silent baseline colors (dim glow + 40% brightness line)
+        self.baseline_glow_color = tuple(int(c * 0.15) for c in self.color)
+        self.baseline_color = tuple(int(c * 0.4) for c in self.color)
+    
+    def _build_wave_colors(self) -> list:
+        """Precompute the faded glow/line colors for each wave.
+        
+        Returns:
+            List of (glow, glow2, main) RGBA tuples indexed by wave
+        """
+        colors = []
+        for wave_idx in range(self.num_waves):
+            opacity = int(200 * (1 - wave_idx / self.num_waves))
+            colors.append((
+                (*self.color, opacity // 4),
+                (*self.color, opacity // 2),
+                (*self.color, opacity)
+            ))
+        return colors
     
     def reset(self):
         """Reset visualizer state."""
         self.time_offset = 0
         self.amplitude_history = [0.0] * self.history_size
         self.current_amplitude = 0.0
-        self.band_amplitudes = [0.0] * self.freq_bands
+        self.band_amplitudes = np.zeros(self.freq_bands)
         self.particles = []
     
     def update(self, audio_data: dict, dt: float):
@@ -57,17 +89,18 @@ class WaveformVisualizer(Visualizer):
             if len(self.amplitude_history) > self.history_size:
                 self.amplitude_history.pop(0)
             
-            # Calculate frequency bands with boost
+            # Calculate frequency bands with boost: mean of each equal-width
+            # block of bins in one reshape (trailing remainder bins are ignored)
             band_size = len(fft_bins) // self.freq_bands
-            for i in range(self.freq_bands):
-                start = i * band_size
-                end = start + band_size
-                self.band_amplitudes[i] = np.mean(fft_bins[start:end]) * 2.0  # 2x boost
+            if band_size > 0:
+                bands = fft_bins[:band_size * self.freq_bands].reshape(self.freq_bands, band_size)
+                self.band_amplitudes = bands.mean(axis=1) * 2.0  # 2x boost
         else:
             # No audio - decay to zero
+            decay = SILENCE_DECAY ** (dt * 60)
             if self.amplitude_history:
-                self.amplitude_history = [a * 0.9 for a in self.amplitude_history]
-            self.band_amplitudes = [a * 0.9 for a in self.band_amplitudes]
+                self.amplitude_history = [a * decay for a in self.amplitude_history]
+            self.band_amplitudes = self.band_amplitudes * decay
         
         # Only update time offset if there's audio activity
         avg_amp = np.mean(self.amplitude_history) if self.amplitude_history else 0
@@ -94,58 +127,58 @@ class WaveformVisualizer(Visualizer):
         # Initialize glow surface if needed
         if self.glow_surface is None or self.glow_surface.get_size() != (w, h):
             self.glow_surface = pygame.Surface((w, h), pygame.SRCALPHA)
+            self.glow_dirty = None
+        
+        # Clear only what was drawn last frame; the waves cover a thin band of the screen
+        if self.glow_dirty is not None:
+            self.glow_surface.fill((0, 0, 0, 0), self.glow_dirty)
+        dirty = []
         
-        # Clear glow surface
-        self.glow_surface.fill((0, 0, 0, 0))
+        # X positions are shared by every wave
+        xs = MARGIN_LEFT + (self._x_ratio * usable_width).astype(np.int32)
         
         # Draw multiple waves with glow
         for wave_idx in range(self.num_waves):
-            points = []
             wave_offset = wave_idx * 0.5
+            phase = self.time_offset + wave_offset + self._x_phase
             
-            for i in range(self.wave_points):
-                x_ratio = i / self.wave_points
-                x = MARGIN_LEFT + int(x_ratio * usable_width)
-                
-                # Calculate wave with multiple frequency components
-                y_offset = 0
-                for band_idx in range(min(3, self.freq_bands)):
-                    freq = (band_idx + 1) * 2
-                    phase = self.time_offset + wave_offset + x_ratio * math.pi * 2
-                    amplitude = self.band_amplitudes[band_idx] * usable_height * 0.25
-                    y_offset += math.sin(freq * phase) * amplitude
-                
-                y = center_y + int(y_offset) + wave_idx * 15
-                points.append((x, y))
+            # Calculate wave with multiple frequency components (vectorized over all points)
+            y_offset = np.zeros(self.wave_points)
+            for band_idx in range(min(3, self.freq_bands)):
+                freq = (band_idx + 1) * 2
+                amplitude = self.band_amplitudes[band_idx] * usable_height * 0.25
+                y_offset += np.sin(freq * phase) * amplitude
+            
+            ys = center_y + y_offset.astype(np.int32) + wave_idx * 15
+            points = np.column_stack((xs, ys)).tolist()
             
             # Draw wave with glow effect
             if len(points) > 1:
-                # Calculate opacity based on wave index
-                opacity = int(200 * (1 - wave_idx / self.num_waves))
+                # Colors fade with wave index (precomputed)
+                glow_color, glow_color2, main_color = self.wave_colors[wave_idx]
                 
-                # Draw thick glow layer
-                glow_color = tuple(list(self.color) + [opacity // 4])
+                # Draw thick glow layer (widest, so its bounds cover the other two)
                 try:
-                    pygame.draw.lines(self.glow_surface, glow_color, False, points, 8)
+                    dirty.append(pygame.draw.lines(self.glow_surface, glow_color, False, points, 8))
                 except Exception:
                     pass
                 
                 # Draw medium glow layer
-                glow_color2 = tuple(list(self.color) + [opacity // 2])
                 try:
                     pygame.draw.lines(self.glow_surface, glow_color2, False, points, 4)
                 except Exception:
                     pass
                 
                 # Draw main line
-                main_color = tuple(list(self.color) + [opacity])
                 try:
                     pygame.draw.lines(self.glow_surface, main_color, False, points, 2)
                 except Exception:
                     pass
         
-        # Blit glow surface to main surface
-        surface.blit(self.glow_surface, (0, 0))
+        # Composite only the drawn area of the glow surface onto the main surface
+        self.glow_dirty = dirty[0].unionall(dirty[1:]) if dirty else None
+        if self.glow_dirty is not None:
+            surface.blit(self.glow_surface, self.glow_dirty, self.glow_dirty)
         
         # Draw particles
         self._draw_particles(surface)
@@ -194,9 +227,7 @@ class WaveformVisualizer(Visualizer):
         end_pos = (MARGIN_LEFT + usable_width, center_y)
         
         # Draw glow layer (thicker, dimmer)
-        glow_color = tuple(int(c * 0.15) for c in self.color)
-        pygame.draw.line(surface, glow_color, start_pos, end_pos, 3)
+        pygame.draw.line(surface, self.baseline_glow_color, start_pos, end_pos, 3)
         
         # Draw main line (thinner, brighter)
-        line_color = tuple(int(c * 0.4) for c in self.color)  # 40% brightness
-        pygame.draw.line(surface, line_color, start_pos, end_pos, 1)
\ No newline at end of file
+        pygame.draw.line(surface, self.baseline_color, start_pos, end_pos, 1)
\ No newline at end of file
@@ -4,14 +4,17 @@ import time
 import os
 import tempfile
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import sounddevice as sd
 import numpy as np
-from scipy.io import wavfile
-from openai import OpenAI
 
 from voice_router import VoiceRouter
 
+# openai and scipy are only needed for STT; they are imported on first use
+if TYPE_CHECKING:
+    from openai import OpenAI
+
 
 class VoiceEngine:
     """Voice engine adapter for microphone input and wakeword detection."""
@@ -32,11 +35,10 @@ class VoiceEngine:
         self.duration = 2.5  # seconds
         
         # OpenAI client (optional - only if API key is set)
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            self.openai_client = OpenAI(api_key=api_key)
-        else:
-            self.openai_client = None
+        # Created on first STT request so startup doesn't pay for it
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.openai_client = None
+        if not self.api_key:
             print("Warning: OPENAI_API_KEY not set. STT will not work.")
     
     def start(self):
@@ -99,11 +101,23 @@ class VoiceEngine:
             # Sleep briefly to avoid busy-waiting
             time.sleep(0.1)
     
+    def _get_openai_client(self) -> "OpenAI | None":
+        """Get the OpenAI client, creating it on first use.
+        
+        Returns:
+            OpenAI client, or None if no API key is set
+        """
+        if self.openai_client is None and self.api_key:
+            from openai import OpenAI
+            self.openai_client = OpenAI(api_key=self.api_key)
+        return self.openai_client
+    
     def _process_stt(self):
         """Process speech-to-text in a separate thread."""
         try:
             # Check if OpenAI client is available
-            if not self.openai_client:
+            openai_client = self._get_openai_client()
+            if not openai_client:
                 print("STT error: OpenAI API key not set")
                 return
             
@@ -118,6 +132,7 @@ class VoiceEngine:
             sd.wait()  # Wait for recording to complete
             
             # Save to temporary WAV file
+            from scipy.io import wavfile
             with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
                 tmp_path = tmp_file.name
                 wavfile.write(tmp_path, self.sample_rate, audio_data)
@@ -125,7 +140,7 @@ class VoiceEngine:
             # Transcribe with OpenAI Whisper
             print("transcribing...")
             with open(tmp_path, "rb") as audio_file:
-                transcript = self.openai_client.audio.transcriptions.create(
+                transcript = openai_client.audio.transcriptions.create(
                     model="whisper-1",
                     file=audio_file,
                     language="en"